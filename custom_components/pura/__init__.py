@@ -15,7 +15,13 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import CONF_ID_TOKEN, CONF_REFRESH_TOKEN, DOMAIN
+from .const import (
+    CONF_ID_TOKEN,
+    CONF_REFRESH_TOKEN,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
 from .coordinator import PuraDataUpdateCoordinator
 from .helpers import get_device_id
 
@@ -34,7 +40,15 @@ PLATFORMS = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: PuraConfigEntry) -> bool:
     """Set up Pura from a config entry."""
-    _unlisten = entry.add_update_listener(update_listener)
+    remove_update_listener = entry.add_update_listener(update_listener)
+
+    @callback
+    def _unlisten() -> None:
+        """Stop reloading the entry on updates."""
+        if update_listener in entry.update_listeners:
+            remove_update_listener()
+
+    entry.async_on_unload(_unlisten)
 
     client = Pura(
         username=entry.data.get(CONF_USERNAME),
@@ -50,7 +64,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: PuraConfigEntry) -> bool
     except Exception as ex:
         raise ConfigEntryNotReady(ex) from ex
 
-    coordinator = PuraDataUpdateCoordinator(hass, client=client)
+    coordinator = PuraDataUpdateCoordinator(
+        hass,
+        client=client,
+        update_interval=entry.options.get(
+            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+        ),
+    )
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
@@ -61,11 +81,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: PuraConfigEntry) -> bool
     def _async_save_tokens(ev: Event) -> None:
         """Save tokens to the config entry data."""
         _unlisten()
-        hass.config_entries.async_update_entry(
-            entry, data=entry.data | client.get_tokens()
-        )
+        tokens = client.get_tokens()
+        if any(entry.data.get(key) != value for key, value in tokens.items()):
+            hass.config_entries.async_update_entry(entry, data=entry.data | tokens)
 
-    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_tokens)
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_tokens)
+    )
 
     return True
 
@@ -84,11 +106,17 @@ async def async_remove_config_entry_device(
     hass: HomeAssistant, entry: PuraConfigEntry, device_entry: DeviceEntry
 ) -> bool:
     """Remove a config entry from a device."""
-    return not any(
-        identifier
-        for identifier in device_entry.identifiers
-        if identifier[0] == DOMAIN
+    if not (
+        identifiers := [
+            identifier[1]
+            for identifier in device_entry.identifiers
+            if identifier[0] == DOMAIN
+        ]
+    ):
+        return True
+    device_ids = {
+        get_device_id(device)
         for devices in entry.runtime_data.devices.values()
         for device in devices
-        if identifier[1] == get_device_id(device)
-    )
+    }
+    return not any(identifier in device_ids for identifier in identifiers)
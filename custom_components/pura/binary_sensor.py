@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -18,25 +19,18 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import PuraConfigEntry
 from .coordinator import PuraDataUpdateCoordinator
 from .entity import PuraEntity
-from .helpers import get_device_id
+from .helpers import descriptions_by_device_type, get_device_id
 
 
-@dataclass
-class RequiredKeysMixin:
-    """Required keys mixin."""
+@dataclass(frozen=True, kw_only=True)
+class PuraBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Pura binary sensor entity description."""
 
     on_fn: Callable[[dict], Any]
 
 
-@dataclass
-class PuraBinarySensorEntityDescription(
-    BinarySensorEntityDescription, RequiredKeysMixin
-):
-    """Pura binary sensor entity description."""
-
-
 SENSORS: dict[tuple[str, ...], tuple[PuraBinarySensorEntityDescription, ...]] = {
-    ("car"): (
+    ("car",): (
         PuraBinarySensorEntityDescription(
             key="low_fragrance",
             name="Low fragrance",
@@ -49,11 +43,13 @@ SENSORS: dict[tuple[str, ...], tuple[PuraBinarySensorEntityDescription, ...]] =
             key="connected",
             name="Connected",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
-            on_fn=lambda data: data["connected"],
+            on_fn=itemgetter("connected"),
         ),
     ),
 }
 
+SENSORS_BY_TYPE = descriptions_by_device_type(SENSORS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: PuraConfigEntry, async_add_entities: AddEntitiesCallback
@@ -61,19 +57,21 @@ async def async_setup_entry(
     """Set up Pura binary sensors using config entry."""
     coordinator: PuraDataUpdateCoordinator = entry.runtime_data
 
-    entities = [
-        PuraBinarySensorEntity(
-            coordinator=coordinator,
-            description=description,
-            device_type=device_type,
-            device_id=get_device_id(device),
-        )
-        for device_types, descriptions in SENSORS.items()
-        for device_type, devices in coordinator.devices.items()
-        if device_type in device_types
-        for device in devices
-        for description in descriptions
-    ]
+    entities: list[PuraBinarySensorEntity] = []
+    for device_type, devices in coordinator.devices.items():
+        if not (descriptions := SENSORS_BY_TYPE.get(device_type)):
+            continue
+        for device in devices:
+            device_id = get_device_id(device)
+            entities.extend(
+                PuraBinarySensorEntity(
+                    coordinator=coordinator,
+                    description=description,
+                    device_type=device_type,
+                    device_id=device_id,
+                )
+                for description in descriptions
+            )
 
     if not entities:
         return
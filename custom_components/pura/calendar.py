@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta, tzinfo
+import functools
 import logging
+from typing import Any
 
 from ical.calendar import Calendar
 from ical.event import Event
@@ -42,6 +44,8 @@ class PuraCalendarEntity(CoordinatorEntity[PuraDataUpdateCoordinator], CalendarE
     """Pura calendar entity."""
 
     _calendar: Calendar | None = None
+    _events: dict[str, tuple[tuple, Event, str]]
+    _signature: tuple = ()
 
     _attr_has_entity_name = True
     _attr_name = "Pura"
@@ -56,6 +60,7 @@ class PuraCalendarEntity(CoordinatorEntity[PuraDataUpdateCoordinator], CalendarE
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}-{description.key}"
+        self._events = {}
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -67,7 +72,7 @@ class PuraCalendarEntity(CoordinatorEntity[PuraDataUpdateCoordinator], CalendarE
         events = self._calendar.timeline_tz(now.tzinfo).active_after(now)
         if not (event := next(events, None)):
             return None
-        return _get_calendar_event(event)
+        return self._get_calendar_event(event)
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
@@ -79,62 +84,120 @@ class PuraCalendarEntity(CoordinatorEntity[PuraDataUpdateCoordinator], CalendarE
         events = self._calendar.timeline_tz(start_date.tzinfo).overlapping(
             start_date, end_date
         )
-        return [_get_calendar_event(event) for event in events]
+        return [self._get_calendar_event(event) for event in events]
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         now = dt_util.now()
-        self._calendar = Calendar()
-        self._calendar.events.extend(
-            Event(
-                summary=f"{schedule['name']} - {device['displayName']['name']}",
-                start=_parse_datetime(now, schedule["start"], schedule["disableUntil"]),
-                end=_parse_datetime(now, schedule["end"], schedule["disableUntil"]),
-                description=f'Fragrance slot {schedule["bay"]} ('
-                + device[f'bay{schedule["bay"]}']["fragrance"]["name"]
-                + f')\nIntensity {schedule["intensity"]}',
-                uid=schedule["id"],
-                rrule=Recur.from_rrule(
-                    f'FREQ=WEEKLY;BYDAY={",".join(day[:2].upper() for day in schedule["days"] if schedule["days"][day])};INTERVAL=1'
-                ),
-            )
+        schedules = [
+            (_schedule_key(now, device, schedule), device, schedule)
             for device_type, devices in self.coordinator.devices.items()
             if device_type in ("wall", "plus")
             for device in devices
             for schedule in device.get("schedules", [])
             if schedule["disableUntil"] != -1
-        )
+        ]
+        signature = tuple(key for key, _, _ in schedules)
+        if self._calendar is None or signature != self._signature:
+            self._signature = signature
+            self._calendar = Calendar()
+            self._calendar.events.extend(
+                [
+                    self._get_event(now, key, device, schedule)
+                    for key, device, schedule in schedules
+                ]
+            )
+            self._events = {
+                event.uid: self._events[event.uid] for event in self._calendar.events
+            }
 
         self.async_write_ha_state()
 
+    def _get_event(
+        self,
+        now: datetime,
+        key: tuple,
+        device: dict[str, Any],
+        schedule: dict[str, Any],
+    ) -> Event:
+        """Return the event for a schedule, reusing it if nothing has changed."""
+        if (cached := self._events.get(uid := schedule["id"])) and cached[0] == key:
+            return cached[1]
+
+        bay = schedule["bay"]
+        today, tz = now.date(), now.tzinfo
+        disable_until = schedule["disableUntil"]
+        event = Event(
+            summary=f"{schedule['name']} - {device['displayName']['name']}",
+            start=_parse_datetime(today, tz, schedule["start"], disable_until),
+            end=_parse_datetime(today, tz, schedule["end"], disable_until),
+            description=f"Fragrance slot {bay} ("
+            + device[f"bay{bay}"]["fragrance"]["name"]
+            + f")\nIntensity {schedule['intensity']}",
+            uid=uid,
+            rrule=_weekly_rrule(
+                tuple(day for day, active in schedule["days"].items() if active)
+            ),
+        )
+        self._events[uid] = (key, event, event.rrule.as_rrule_str())
+        return event
+
+    def _get_calendar_event(self, event: Event) -> CalendarEvent:
+        """Return a CalendarEvent from an iCal Event."""
+        return CalendarEvent(
+            summary=event.summary,
+            start=dt_util.as_local(event.start),
+            end=dt_util.as_local(event.end),
+            description=event.description,
+            rrule=self._events[event.uid][2],
+        )
+
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         self._handle_coordinator_update()
         await super().async_added_to_hass()
 
 
+def _schedule_key(
+    now: datetime, device: dict[str, Any], schedule: dict[str, Any]
+) -> tuple:
+    """Return the values that determine a schedule's calendar event."""
+    bay = schedule["bay"]
+    return (
+        schedule["id"],
+        now.date(),
+        device["displayName"]["name"],
+        device[f"bay{bay}"]["fragrance"]["name"],
+        schedule["name"],
+        schedule["start"],
+        schedule["end"],
+        schedule["disableUntil"],
+        schedule["intensity"],
+        bay,
+        tuple(sorted(schedule["days"].items())),
+    )
+
+
 def _parse_datetime(
-    now: datetime, time_str: str, disable_until: int | None = None
-) -> datetime | None:
+    today: date, tz: tzinfo | None, time_str: str, disable_until: int | None = None
+) -> datetime:
     """Parse datetime."""
-    _date = dt_util.dt.datetime.combine(now, _parse_time(time_str), now.tzinfo)
-    if disable_until and _date <= datetime.fromtimestamp(disable_until, now.tzinfo):
+    _date = datetime.combine(today, _parse_time(time_str), tz)
+    if disable_until and _date <= datetime.fromtimestamp(disable_until, tz):
         _date += ONE_DAY
     return _date
 
 
-def _parse_time(time_str: str) -> dt_util.dt.time | None:
+@functools.lru_cache(maxsize=64)
+def _parse_time(time_str: str) -> time:
     """Parse time."""
-    return dt_util.parse_time(f"{time_str[:2]}:{time_str[2:]}")
+    return time(int(time_str[:2]), int(time_str[2:]))
 
 
-def _get_calendar_event(event: Event) -> CalendarEvent:
-    """Return a CalendarEvent from an iCal Event."""
-    return CalendarEvent(
-        summary=event.summary,
-        start=dt_util.as_local(event.start),
-        end=dt_util.as_local(event.end),
-        description=event.description,
-        rrule=event.rrule.as_rrule_str(),
+@functools.lru_cache(maxsize=64)
+def _weekly_rrule(days: tuple[str, ...]) -> Recur:
+    """Return a weekly recurrence rule for the given days."""
+    return Recur.from_rrule(
+        f"FREQ=WEEKLY;BYDAY={','.join(day[:2].upper() for day in days)};INTERVAL=1"
     )
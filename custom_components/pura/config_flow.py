@@ -1,17 +1,19 @@
 """Pura config flow."""
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Any
 
 from pypura import Pura, PuraAuthenticationError
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -19,11 +21,28 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+@functools.lru_cache(maxsize=8)
+def _reauth_schema(username: str | None) -> vol.Schema:
+    """Return the reauth schema with the username defaulted."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_USERNAME, default=username): str,
+            vol.Required(CONF_PASSWORD): str,
+        }
+    )
+
+
 class PuraConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Pura."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> PuraOptionsFlow:
+        """Get the options flow for this handler."""
+        return PuraOptionsFlow()
+
     async def _async_create_entry(self, user_input: dict[str, Any]) -> FlowResult:
         """Create the config entry."""
         existing_entry = await self.async_set_unique_id(DOMAIN)
@@ -95,16 +114,8 @@ class PuraConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is None:
             user_input = {}
 
-        reauth_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_USERNAME,
-                    default=user_input.get(
-                        CONF_USERNAME, self.init_data.get(CONF_USERNAME)
-                    ),
-                ): str,
-                vol.Required(CONF_PASSWORD): str,
-            }
+        reauth_schema = _reauth_schema(
+            user_input.get(CONF_USERNAME, self.init_data.get(CONF_USERNAME))
         )
 
         if user_input.get(CONF_PASSWORD) is None:
@@ -115,3 +126,28 @@ class PuraConfigFlow(ConfigFlow, domain=DOMAIN):
         return await self.async_pura_login(
             step_id="reauth_confirm", user_input=user_input, schema=reauth_schema
         )
+
+
+class PuraOptionsFlow(OptionsFlow):
+    """Handle Pura options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_UPDATE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                }
+            ),
+        )
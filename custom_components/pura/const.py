@@ -8,6 +8,9 @@ DOMAIN: Final = "pura"
 
 CONF_ID_TOKEN: Final = "id_token"
 CONF_REFRESH_TOKEN: Final = "refresh_token"
+CONF_UPDATE_INTERVAL: Final = "update_interval"
+
+DEFAULT_UPDATE_INTERVAL: Final = 30
 
 ATTR_SLOT: Final = "slot"
 ATTR_INTENSITY: Final = "intensity"
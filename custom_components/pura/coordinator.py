@@ -4,46 +4,114 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
+import sys
 from typing import Any
 
 from deepdiff import DeepDiff
 from pypura import Pura
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import (
+    CONNECTION_BLUETOOTH,
+    CONNECTION_NETWORK_MAC,
+    DeviceInfo,
+    format_mac,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-from .helpers import get_device_id
+from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .helpers import determine_pura_model, get_device_id, parse_firmware_details
 
 _LOGGER = logging.getLogger(__name__)
-UPDATE_INTERVAL = 30
+UPDATE_INTERVAL = DEFAULT_UPDATE_INTERVAL
+FIRMWARE_UPDATE_INTERVAL = 15 * 60
 
 
 class PuraDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
-    def __init__(self, hass: HomeAssistant, client: Pura) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: Pura,
+        update_interval: int = UPDATE_INTERVAL,
+    ) -> None:
         """Initialize."""
         self.api = client
         self.devices: dict[str, list[dict[str, Any]]] = {}
+        self._device_index: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._device_info: dict[str, DeviceInfo] = {}
+        self._schedule_index: dict[str, dict[str, dict[str, Any]]] = {}
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=timedelta(seconds=update_interval),
         )
 
     def get_device(self, device_type: str, device_id: str) -> dict | None:
         """Get device by type and id."""
-        return next(
-            (
-                device
-                for device in self.devices[device_type]
-                if get_device_id(device) == device_id
-            ),
-            None,
+        indexed_type, device = self._device_index.get(device_id, (None, None))
+        return device if indexed_type == device_type else None
+
+    def get_schedule(self, device_id: str, number: str) -> dict[str, Any] | None:
+        """Get a device schedule by its number."""
+        return self._schedule_index.get(device_id, {}).get(number)
+
+    def get_device_info(self, device_type: str, device_id: str) -> DeviceInfo:
+        """Get the shared device info for a device, building it if needed."""
+        if device_info := self._device_info.get(device_id):
+            return device_info
+
+        device = self.get_device(device_type, device_id)
+        name = device["displayName"]["name"]
+        is_wifi = device_type in ("wall", "plus")
+        device_info = DeviceInfo(
+            connections={
+                (
+                    CONNECTION_NETWORK_MAC if is_wifi else CONNECTION_BLUETOOTH,
+                    format_mac(device_id),
+                )
+            },
+            identifiers={(DOMAIN, device_id)},
+            manufacturer="Pura",
+            model=determine_pura_model(device),
+            name=f"{name} Diffuser",
+            suggested_area=name if is_wifi else None,
+            sw_version=device["fwVersion"],
+            hw_version=device["hwVersion"],
         )
+        self._device_info[device_id] = device_info
+        return device_info
+
+    def _log_device_changes(self, devices: dict[str, list[dict[str, Any]]]) -> None:
+        """Log the differences for the devices that changed."""
+        old = {
+            device_id: device for device_id, (_, device) in self._device_index.items()
+        }
+        new = {
+            get_device_id(device): device
+            for device_list in devices.values()
+            for device in device_list
+        }
+        if not (
+            changed := [
+                device_id
+                for device_id in old.keys() | new.keys()
+                if old.get(device_id) != new.get(device_id)
+            ]
+        ):
+            _LOGGER.debug("Devices updated: no changes")
+            return
+        diff = DeepDiff(
+            {device_id: old.get(device_id) for device_id in changed},
+            {device_id: new.get(device_id) for device_id in changed},
+            ignore_order=True,
+            report_repetition=True,
+            verbose_level=2,
+        )
+        _LOGGER.debug("Devices updated: %s", diff or "no changes")
 
     async def _async_update_data(self):
         """Update data via library, refresh token if necessary."""
@@ -51,15 +119,25 @@ class PuraDataUpdateCoordinator(DataUpdateCoordinator):
             if devices := await self.hass.async_add_executor_job(
                 self.api.get_devices_v2
             ):
-                diff = DeepDiff(
-                    self.devices,
-                    devices,
-                    ignore_order=True,
-                    report_repetition=True,
-                    verbose_level=2,
-                )
-                _LOGGER.debug("Devices updated: %s", diff if diff else "no changes")
+                devices = {
+                    sys.intern(device_type): device_list
+                    for device_type, device_list in devices.items()
+                }
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    self._log_device_changes(devices)
                 self.devices = devices
+                self._device_index = {
+                    get_device_id(device): (device_type, device)
+                    for device_type, device_list in devices.items()
+                    for device in device_list
+                }
+                self._schedule_index = {
+                    device_id: {
+                        str(schedule["number"]): schedule
+                        for schedule in device.get("schedules", [])
+                    }
+                    for device_id, (_, device) in self._device_index.items()
+                }
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error(
                 "Unknown exception while updating Pura data: %s", err, exc_info=1
@@ -79,7 +157,7 @@ class PuraCarFirmwareDataUpdateCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=timedelta(seconds=FIRMWARE_UPDATE_INTERVAL),
         )
 
     async def _async_update_data(self):
@@ -88,10 +166,7 @@ class PuraCarFirmwareDataUpdateCoordinator(DataUpdateCoordinator):
             details: str = await self.hass.async_add_executor_job(
                 self.api.get_latest_firmware_details, "car", "v1"
             )
-            return {
-                (part := line.split("=", 1))[0].lower(): part[1]
-                for line in details.split("\n")
-            }
+            return parse_firmware_details(details)
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error(
                 "Unknown exception while updating Pura data: %s", err, exc_info=1
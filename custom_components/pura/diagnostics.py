@@ -10,16 +10,18 @@ from homeassistant.core import HomeAssistant
 
 from . import PuraConfigEntry
 
-TO_REDACT = {
-    CONF_LATITUDE,
-    CONF_LONGITUDE,
-    "device_id",
-    "deviceId",
-    "pk",
-    "serialNumber",
-    "sk",
-    "uid",
-}
+TO_REDACT = frozenset(
+    {
+        CONF_LATITUDE,
+        CONF_LONGITUDE,
+        "device_id",
+        "deviceId",
+        "pk",
+        "serialNumber",
+        "sk",
+        "uid",
+    }
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -2,35 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
-from homeassistant.helpers.device_registry import (
-    CONNECTION_BLUETOOTH,
-    CONNECTION_NETWORK_MAC,
-    format_mac,
-)
-from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import PuraDataUpdateCoordinator
 
 UPDATE_INTERVAL = 30
 
-PURA_MODEL_MAP = {1: "Wall", 2: "Car", "car": "Car", 3: "Plus", 4: "Mini"}
-
-
-def determine_pura_model(data: dict[str, Any]) -> str | None:
-    """Determine pura device model."""
-    if (model := PURA_MODEL_MAP.get(m := data.get("model"), m)) == "Wall":
-        version = data.get("hwVersion", "3").split(".", 1)[0]
-        model = "3" if version in ("1", "2") else version
-    return f"Pura {model}"
+BAY_KEYS = {1: "bay1", 2: "bay2"}
+BAY_INTENSITY_KEYS = {1: "bay1Intensity", 2: "bay2Intensity"}
 
 
 def has_fragrance(data: dict, bay: int) -> bool:
     """Check if the specified bay has a fragrance."""
-    return bool(data[f"bay{bay}"])
+    return bool(data[BAY_KEYS[bay]])
 
 
 class PuraEntity(CoordinatorEntity[PuraDataUpdateCoordinator]):
@@ -51,45 +40,45 @@ class PuraEntity(CoordinatorEntity[PuraDataUpdateCoordinator]):
         self._device_type = device_type
         self._device_id = device_id
         self._attr_unique_id = f"{device_id}-{description.key}"
-
-        device = self.get_device()
-        name = device["displayName"]["name"]
-        self._attr_device_info = DeviceInfo(
-            connections={
-                (
-                    CONNECTION_NETWORK_MAC
-                    if device_type in ("wall", "plus")
-                    else CONNECTION_BLUETOOTH,
-                    format_mac(device_id),
-                )
-            },
-            identifiers={(DOMAIN, device_id)},
-            manufacturer="Pura",
-            model=determine_pura_model(device),
-            name=f"{name} Diffuser",
-            suggested_area=name if device_type in ("wall", "plus") else None,
-            sw_version=device["fwVersion"],
-            hw_version=device["hwVersion"],
-        )
+        self._attr_device_info = coordinator.get_device_info(device_type, device_id)
+        self._views: dict[str, Any] = {}
 
     def get_device(self) -> dict | None:
         """Get the device from the coordinator."""
         return self.coordinator.get_device(self._device_type, self._device_id)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._views.clear()
+        super()._handle_coordinator_update()
+
+    def _cached_view(self, key: str, build_fn: Callable[[], Any]) -> Any:
+        """Return a view of the device data, computed once per coordinator update."""
+        if (view := self._views.get(key)) is None:
+            view = self._views[key] = build_fn()
+        return view
+
     @property
     def _intensity_data(self) -> dict:
         """Get the intensity data."""
+        return self._cached_view("intensity", self._build_intensity_data)
+
+    def _build_intensity_data(self) -> dict:
+        """Build the intensity data."""
         device = self.get_device()
         if (controller := device["controller"]) == "timer":
-            return device[controller] | {"controller": controller}
-        if controller.isnumeric():
-            for schedule in device["schedules"]:
-                if str(schedule["number"]) == controller:
-                    return schedule | {"controller": "schedule"}
-        bay = 0
-        if (data := device["bay1"]) and data["activeAt"]:
-            bay = 1
-        elif (data := device["bay2"]) and data["activeAt"]:
-            bay = 2
-        intensity = device["deviceDefaults"][f"bay{bay}Intensity"] if bay else None
-        return {"bay": bay, "controller": str(controller), "intensity": intensity}
+            return {**device[controller], "controller": controller}
+        if controller.isnumeric() and (
+            schedule := self.coordinator.get_schedule(self._device_id, controller)
+        ):
+            return {**schedule, "controller": "schedule"}
+        for bay, bay_key in BAY_KEYS.items():
+            if (data := device[bay_key]) and data["activeAt"]:
+                intensity = device["deviceDefaults"][BAY_INTENSITY_KEYS[bay]]
+                return {
+                    "bay": bay,
+                    "controller": str(controller),
+                    "intensity": intensity,
+                }
+        return {"bay": 0, "controller": str(controller), "intensity": None}
@@ -3,7 +3,26 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Any
+import functools
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+PURA_MODEL_MAP = {1: "Wall", 2: "Car", "car": "Car", 3: "Plus", 4: "Mini"}
+
+
+def determine_pura_model(data: dict[str, Any]) -> str | None:
+    """Determine pura device model."""
+    return _pura_model(data.get("model"), data.get("hwVersion", "3"))
+
+
+@functools.lru_cache(maxsize=64)
+def _pura_model(model: Any, hw_version: str) -> str:
+    """Determine pura device model from the raw model and hardware version."""
+    if (model := PURA_MODEL_MAP.get(model, model)) == "Wall":
+        version = hw_version.partition(".")[0]
+        model = "3" if version in ("1", "2") else version
+    return f"Pura {model}"
 
 
 def first_key_value(
@@ -16,6 +35,27 @@ def first_key_value(
     return default
 
 
+def parse_firmware_details(details: str) -> dict[str, str]:
+    """Parse `key=value` firmware details into a dictionary with lowercase keys."""
+    firmware: dict[str, str] = {}
+    for line in details.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            firmware[key.lower()] = value
+    return firmware
+
+
 def get_device_id(data: dict[str, Any]) -> str | None:
     """Get the device id from a dictionary."""
     return data["deviceId"]
+
+
+def descriptions_by_device_type(
+    descriptions: dict[tuple[str, ...], tuple[_T, ...]],
+) -> dict[str, tuple[_T, ...]]:
+    """Index entity descriptions by each individual device type."""
+    indexed: dict[str, tuple[_T, ...]] = {}
+    for device_types, items in descriptions.items():
+        for device_type in device_types:
+            indexed[device_type] = indexed.get(device_type, ()) + items
+    return indexed
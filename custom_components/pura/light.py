@@ -14,7 +14,7 @@ from homeassistant.components.light import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.color import color_rgb_to_hex, rgb_hex_to_rgb_list
+from homeassistant.util.color import color_rgb_to_hex
 
 from . import PuraConfigEntry
 from .coordinator import PuraDataUpdateCoordinator
@@ -34,12 +34,10 @@ async def async_setup_entry(
         PuraLightEntity(
             coordinator=coordinator,
             description=LIGHT_DESCRIPTION,
-            device_type=device_type,
+            device_type="wall",
             device_id=get_device_id(device),
         )
-        for device_type, devices in coordinator.devices.items()
-        if device_type == "wall"
-        for device in devices
+        for device in coordinator.devices.get("wall", ())
     ]
 
     if not entities:
@@ -70,18 +68,22 @@ class PuraLightEntity(PuraEntity, LightEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int]:
         """Return the rgb color value [int, int, int]."""
-        return tuple(rgb_hex_to_rgb_list(self._nightlight_data["color"]))
+        value = int(self._nightlight_data["color"].lstrip("#"), 16)
+        return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
 
     @property
     def _nightlight_data(self) -> dict:
         """Get the nightlight data."""
+        return self._cached_view("nightlight", self._build_nightlight_data)
+
+    def _build_nightlight_data(self) -> dict:
+        """Build the nightlight data."""
         device = self.get_device()
         data: dict | None = None
-        if (controller := device["controller"]).isnumeric():
-            for schedule in device["schedules"]:
-                if str(schedule["number"]) == controller:
-                    data = schedule["nightlight"]
-                    break
+        if (controller := device["controller"]).isnumeric() and (
+            schedule := self.coordinator.get_schedule(self._device_id, controller)
+        ):
+            data = schedule["nightlight"]
         if not data:
             data = device["deviceDefaults"]["nightlight"]
         return data | {"controller": str(controller)}
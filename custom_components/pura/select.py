@@ -6,6 +6,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 import functools
+from types import MappingProxyType
 
 import voluptuous as vol
 
@@ -22,22 +23,22 @@ from homeassistant.helpers.entity_platform import (
 from . import PuraConfigEntry
 from .const import ATTR_DURATION, ATTR_INTENSITY, ATTR_SLOT, DOMAIN
 from .coordinator import PuraDataUpdateCoordinator
-from .entity import PuraEntity, has_fragrance
+from .entity import BAY_KEYS, PuraEntity, has_fragrance
 from .helpers import get_device_id
 
-INTENSITY_MAP = {"subtle": 3, "medium": 6, "strong": 10}
+INTENSITY_MAP = MappingProxyType({"subtle": 3, "medium": 6, "strong": 10})
+SLOT_MAP = MappingProxyType({"slot_1": 1, "slot_2": 2})
+SLOT_OPTIONS = ("off", "slot_1", "slot_2")
 
 SERVICE_START_TIMER = "start_timer"
-SERVICE_TIMER_SCHEMA = vol.All(
-    cv.make_entity_service_schema(
-        {
-            vol.Optional(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=2)),
-            vol.Required(ATTR_INTENSITY): vol.All(
-                vol.Coerce(int), vol.Range(min=1, max=10)
-            ),
-            vol.Required(ATTR_DURATION): cv.positive_time_period,
-        },
-    )
+SERVICE_TIMER_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=2)),
+        vol.Required(ATTR_INTENSITY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10)
+        ),
+        vol.Required(ATTR_DURATION): cv.positive_time_period,
+    },
 )
 
 
@@ -47,18 +48,19 @@ async def async_setup_entry(
     """Set up Pura selects using config entry."""
     coordinator: PuraDataUpdateCoordinator = entry.runtime_data
 
-    entities = [
-        PuraSelectEntity(
-            coordinator=coordinator,
-            description=descriptor,
-            device_type=device_type,
-            device_id=get_device_id(device),
-        )
-        for device_type, devices in coordinator.devices.items()
-        if device_type in ("wall", "plus")
-        for device in devices
-        for descriptor in SELECT_DESCRIPTIONS
-    ]
+    entities: list[PuraSelectEntity] = []
+    for device_type in ("wall", "plus"):
+        for device in coordinator.devices.get(device_type, ()):
+            device_id = get_device_id(device)
+            entities.extend(
+                PuraSelectEntity(
+                    coordinator=coordinator,
+                    description=descriptor,
+                    device_type=device_type,
+                    device_id=device_id,
+                )
+                for descriptor in SELECT_DESCRIPTIONS
+            )
 
     if not entities:
         return
@@ -71,7 +73,7 @@ async def async_setup_entry(
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(frozen=True, kw_only=True)
 class PuraSelectEntityDescription(SelectEntityDescription):
     """Pura select entity description."""
 
@@ -80,17 +82,53 @@ class PuraSelectEntityDescription(SelectEntityDescription):
     select_fn: Callable[[PuraSelectEntity, str], functools.partial[bool]]
 
 
+def _intensity_job(select: PuraSelectEntity, option: str) -> functools.partial[bool]:
+    """Return the job to set the intensity for the active fragrance."""
+    data = select._intensity_data
+    if (controller := data["controller"]) == "schedule":
+        controller = str(data["number"])
+    return functools.partial(
+        select.coordinator.api.set_intensity,
+        select._device_id,
+        bay=data["bay"],
+        controller=controller,
+        intensity=INTENSITY_MAP[option],
+    )
+
+
+def _timer_slot(device: dict, slot: int | None) -> int:
+    """Return the slot to start a timer on, preferring the least used fragrance."""
+    if slot and has_fragrance(device, slot):
+        return slot
+    if not (fragrance_bays := [bay for bay in BAY_KEYS if has_fragrance(device, bay)]):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="no_fragrances_installed"
+        )
+    if slot:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="fragrance_slot_empty",
+            translation_placeholders={"slot": slot},
+        )
+    if len(fragrance_bays) == 1:
+        return fragrance_bays[0]
+    runtime = "wearingTime"
+    return 1 if device["bay1"][runtime] <= device["bay2"][runtime] else 2
+
+
 SELECT_DESCRIPTIONS = (
     PuraSelectEntityDescription(
         key="fragrance",
         translation_key="fragrance",
-        current_fn=lambda data: "off" if (b := data["bay"]) == 0 else f"slot_{b}",
-        options_fn=lambda data: ["off"]
-        + [f"slot_{i}" for i in (1, 2) if has_fragrance(data, i)],
+        current_fn=lambda data: SLOT_OPTIONS[data["bay"]],
+        options_fn=lambda data: (
+            [SLOT_OPTIONS[0]]
+            + [SLOT_OPTIONS[i] for i in (1, 2) if has_fragrance(data, i)]
+        ),
         select_fn=lambda select, option: functools.partial(
             select.coordinator.api.set_always_on,
             select._device_id,
-            bay=int(option.replace("slot_", "")),
+            bay=SLOT_MAP[option],
         ),
     ),
     PuraSelectEntityDescription(
@@ -99,17 +137,7 @@ SELECT_DESCRIPTIONS = (
         entity_category=EntityCategory.CONFIG,
         current_fn=lambda data: data["intensity"] or "off",
         options=["off", "subtle", "medium", "strong"],
-        select_fn=lambda select, option: functools.partial(
-            select.coordinator.api.set_intensity,
-            select._device_id,
-            bay=select._intensity_data["bay"],
-            controller=(
-                str(select._intensity_data["number"])
-                if (controller := select._intensity_data["controller"]) == "schedule"
-                else controller
-            ),
-            intensity=INTENSITY_MAP[option],
-        ),
+        select_fn=_intensity_job,
     ),
 )
 
@@ -128,13 +156,18 @@ class PuraSelectEntity(PuraEntity, SelectEntity):
     def options(self) -> list[str]:
         """Return a set of selectable options."""
         if options_fn := self.entity_description.options_fn:
-            return options_fn(self.get_device())
+            return self._cached_view("options", lambda: options_fn(self.get_device()))
         return super().options
 
+    @functools.cached_property
+    def _stop_job(self) -> functools.partial[bool]:
+        """Return the job to stop all fragrances on this device."""
+        return functools.partial(self.coordinator.api.stop_all, self._device_id)
+
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         if option == "off":
-            job = functools.partial(self.coordinator.api.stop_all, self._device_id)
+            job = self._stop_job
         elif self.get_device()["controller"] == "away":
             raise ServiceValidationError(
                 translation_domain=DOMAIN, translation_key="away_mode_active"
@@ -153,25 +186,7 @@ class PuraSelectEntity(PuraEntity, SelectEntity):
         self, *, slot: int | None = None, intensity: int, duration: timedelta
     ) -> None:
         """Start a fragrance timer."""
-        device = self.get_device()
-        if not (fragrance_bays := [i for i in (1, 2) if has_fragrance(device, i)]):
-            raise ServiceValidationError(
-                translation_domain=DOMAIN, translation_key="no_fragrances_installed"
-            )
-
-        if not slot:
-            if len(fragrance_bays) == 1:
-                slot = fragrance_bays[0]
-            else:
-                runtime = "wearingTime"
-                slot = 1 if device["bay1"][runtime] <= device["bay2"][runtime] else 2
-        elif slot not in fragrance_bays:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="fragrance_slot_empty",
-                translation_placeholders={"slot": slot},
-            )
-
+        slot = _timer_slot(self.get_device(), slot)
         if await self.hass.async_add_executor_job(
             functools.partial(
                 self.coordinator.api.set_timer,
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
+import functools
+import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -16,53 +18,62 @@ from homeassistant.components.sensor import (
 from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.dt import UTC, utc_from_timestamp
+from homeassistant.util.dt import utc_from_timestamp
 
 from . import PuraConfigEntry
 from .coordinator import PuraDataUpdateCoordinator
-from .entity import PuraEntity, has_fragrance
-from .helpers import get_device_id
+from .entity import BAY_KEYS, PuraEntity, has_fragrance
+from .helpers import descriptions_by_device_type, get_device_id
 
 
-@dataclass
-class RequiredKeysMixin:
-    """Required keys mixin."""
-
-    value_fn: Callable[[dict], Any | None]
-
-
-@dataclass
-class PuraSensorEntityDescription(SensorEntityDescription, RequiredKeysMixin):
+@dataclass(frozen=True, kw_only=True)
+class PuraSensorEntityDescription(SensorEntityDescription):
     """Pura sensor entity description."""
 
     available_fn: Callable[[dict], bool] | None = None
+    value_fn: Callable[[dict], Any | None]
 
 
-def fragrance_remaining(data: dict, bay: str) -> float:
+def fragrance_remaining(data: dict, bay: int) -> float:
     """Return the fragrance remaining."""
-    bay_data = data[f"bay{bay}"]
-    expected_life = bay_data["fragrance"]["expectedLifeHours"] * 3600
-    return (max(expected_life - fragrance_runtime(data, bay), 0) / expected_life) * 100
+    expected_life = data[BAY_KEYS[bay]]["fragrance"]["expectedLifeHours"] * 3600
+    runtime = fragrance_runtime(data, bay)
+    return (max(expected_life - runtime, 0) / expected_life) * 100
 
 
-def fragrance_runtime(data: dict, bay: str) -> int:
+def fragrance_runtime(data: dict, bay: int) -> int:
     """Return the fragrance runtime."""
-    bay_data = data[f"bay{bay}"]
+    bay_data = data[BAY_KEYS[bay]]
     wearing_time = bay_data["wearingTime"]
     if (active_at := bay_data["activeAt"]) and not data["lastConnectedAt"]:
-        active_time = datetime.now(UTC) - datetime.fromtimestamp(active_at, UTC)
-        wearing_time += int(active_time.total_seconds())
+        wearing_time += int(time.time()) - active_at
     return wearing_time
 
 
+def active_fragrance(data: dict) -> str:
+    """Return the name of the active fragrance."""
+    for bay_key in BAY_KEYS.values():
+        if (bay := data[bay_key]) and bay["activeAt"]:
+            return bay["fragrance"]["name"]
+    return "none"
+
+
+def controller_label(data: dict) -> str:
+    """Return the controller, grouping numbered schedules as "schedule"."""
+    controller = data["controller"]
+    return "schedule" if controller.isnumeric() else controller
+
+
+HAS_FRAGRANCE = {bay: functools.partial(has_fragrance, bay=bay) for bay in BAY_KEYS}
+
 SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
-    ("car"): (
+    ("car",): (
         PuraSensorEntityDescription(
             key="fragrance",
             translation_key="fragrance",
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:scent",
-            available_fn=lambda data: has_fragrance(data, 1),
+            available_fn=HAS_FRAGRANCE[1],
             value_fn=lambda data: data["bay1"]["fragrance"]["name"],
         ),
         PuraSensorEntityDescription(
@@ -73,15 +84,15 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             native_unit_of_measurement=PERCENTAGE,
             state_class=SensorStateClass.MEASUREMENT,
             suggested_display_precision=0,
-            available_fn=lambda data: has_fragrance(data, 1),
-            value_fn=lambda data: fragrance_remaining(data, 1),
+            available_fn=HAS_FRAGRANCE[1],
+            value_fn=functools.partial(fragrance_remaining, bay=1),
         ),
         PuraSensorEntityDescription(
             key="intensity",
             translation_key="intensity",
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:fan",
-            available_fn=lambda data: has_fragrance(data, 1),
+            available_fn=HAS_FRAGRANCE[1],
             value_fn=lambda data: data["bay1"]["fanIntensity"],
         ),
         PuraSensorEntityDescription(
@@ -89,8 +100,8 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             translation_key="last_active",
             device_class=SensorDeviceClass.TIMESTAMP,
             entity_category=EntityCategory.DIAGNOSTIC,
-            available_fn=lambda data: has_fragrance(data, 1),
-            value_fn=lambda data: datetime.fromtimestamp(data["bay1"]["activeAt"], UTC),
+            available_fn=HAS_FRAGRANCE[1],
+            value_fn=lambda data: utc_from_timestamp(data["bay1"]["activeAt"]),
         ),
         PuraSensorEntityDescription(
             key="runtime",
@@ -100,7 +111,7 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             native_unit_of_measurement=UnitOfTime.SECONDS,
             state_class=SensorStateClass.TOTAL_INCREASING,
             suggested_unit_of_measurement=UnitOfTime.HOURS,
-            available_fn=lambda data: has_fragrance(data, 1),
+            available_fn=HAS_FRAGRANCE[1],
             value_fn=lambda data: data["bay1"]["wearingTime"],
         ),
     ),
@@ -109,13 +120,7 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             key="active_fragrance",
             translation_key="active_fragrance",
             icon="mdi:scent",
-            value_fn=lambda data: bay["fragrance"]["name"]
-            if (bay := data["bay1"]) and bay["activeAt"]
-            else (
-                bay["fragrance"]["name"]
-                if (bay := data["bay2"]) and bay["activeAt"]
-                else "none"
-            ),
+            value_fn=active_fragrance,
         ),
         PuraSensorEntityDescription(
             key="bay_1",
@@ -123,7 +128,7 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             translation_placeholders={"bay": 1},
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:scent",
-            available_fn=lambda data: has_fragrance(data, 1),
+            available_fn=HAS_FRAGRANCE[1],
             value_fn=lambda data: data["bay1"]["fragrance"]["name"],
         ),
         PuraSensorEntityDescription(
@@ -135,8 +140,8 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             native_unit_of_measurement=PERCENTAGE,
             state_class=SensorStateClass.MEASUREMENT,
             suggested_display_precision=0,
-            available_fn=lambda data: has_fragrance(data, 1),
-            value_fn=lambda data: fragrance_remaining(data, 1),
+            available_fn=HAS_FRAGRANCE[1],
+            value_fn=functools.partial(fragrance_remaining, bay=1),
         ),
         PuraSensorEntityDescription(
             key="bay_1_runtime",
@@ -147,8 +152,8 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             native_unit_of_measurement=UnitOfTime.SECONDS,
             state_class=SensorStateClass.TOTAL_INCREASING,
             suggested_unit_of_measurement=UnitOfTime.HOURS,
-            available_fn=lambda data: has_fragrance(data, 1),
-            value_fn=lambda data: fragrance_runtime(data, 1),
+            available_fn=HAS_FRAGRANCE[1],
+            value_fn=functools.partial(fragrance_runtime, bay=1),
         ),
         PuraSensorEntityDescription(
             key="bay_1_installed",
@@ -157,8 +162,8 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             device_class=SensorDeviceClass.TIMESTAMP,
             entity_category=EntityCategory.DIAGNOSTIC,
             entity_registry_enabled_default=False,
-            available_fn=lambda data: has_fragrance(data, 1),
-            value_fn=lambda data: datetime.fromtimestamp(data["bay1"]["id"], UTC),
+            available_fn=HAS_FRAGRANCE[1],
+            value_fn=lambda data: utc_from_timestamp(data["bay1"]["id"]),
         ),
         PuraSensorEntityDescription(
             key="bay_2",
@@ -166,7 +171,7 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             translation_placeholders={"bay": 2},
             entity_category=EntityCategory.DIAGNOSTIC,
             icon="mdi:scent",
-            available_fn=lambda data: has_fragrance(data, 2),
+            available_fn=HAS_FRAGRANCE[2],
             value_fn=lambda data: data["bay2"]["fragrance"]["name"],
         ),
         PuraSensorEntityDescription(
@@ -178,8 +183,8 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             native_unit_of_measurement=PERCENTAGE,
             state_class=SensorStateClass.MEASUREMENT,
             suggested_display_precision=0,
-            available_fn=lambda data: has_fragrance(data, 2),
-            value_fn=lambda data: fragrance_remaining(data, 2),
+            available_fn=HAS_FRAGRANCE[2],
+            value_fn=functools.partial(fragrance_remaining, bay=2),
         ),
         PuraSensorEntityDescription(
             key="bay_2_runtime",
@@ -190,8 +195,8 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             native_unit_of_measurement=UnitOfTime.SECONDS,
             state_class=SensorStateClass.TOTAL_INCREASING,
             suggested_unit_of_measurement=UnitOfTime.HOURS,
-            available_fn=lambda data: has_fragrance(data, 2),
-            value_fn=lambda data: fragrance_runtime(data, 2),
+            available_fn=HAS_FRAGRANCE[2],
+            value_fn=functools.partial(fragrance_runtime, bay=2),
         ),
         PuraSensorEntityDescription(
             key="bay_2_installed",
@@ -200,16 +205,14 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
             device_class=SensorDeviceClass.TIMESTAMP,
             entity_category=EntityCategory.DIAGNOSTIC,
             entity_registry_enabled_default=False,
-            available_fn=lambda data: has_fragrance(data, 2),
-            value_fn=lambda data: datetime.fromtimestamp(data["bay2"]["id"], UTC),
+            available_fn=HAS_FRAGRANCE[2],
+            value_fn=lambda data: utc_from_timestamp(data["bay2"]["id"]),
         ),
         PuraSensorEntityDescription(
             key="controller",
             translation_key="controller",
             entity_category=EntityCategory.DIAGNOSTIC,
-            value_fn=lambda data: "schedule"
-            if (controller := data["controller"]).isnumeric()
-            else controller,
+            value_fn=controller_label,
         ),
         PuraSensorEntityDescription(
             key="timer",
@@ -222,6 +225,8 @@ SENSORS: dict[tuple[str, ...], tuple[PuraSensorEntityDescription, ...]] = {
     ),
 }
 
+SENSORS_BY_TYPE = descriptions_by_device_type(SENSORS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: PuraConfigEntry, async_add_entities: AddEntitiesCallback
@@ -229,24 +234,25 @@ async def async_setup_entry(
     """Set up Pura sensors using config entry."""
     coordinator: PuraDataUpdateCoordinator = entry.runtime_data
 
-    entities = [
-        PuraSensorEntity(
-            coordinator=coordinator,
-            description=description,
-            device_type=device_type,
-            device_id=get_device_id(device),
-        )
-        for device_types, descriptions in SENSORS.items()
-        for device_type, devices in coordinator.devices.items()
-        if device_type in device_types
-        for device in devices
-        for description in descriptions
-    ]
+    async_add_entities(_iter_entities(coordinator))
 
-    if not entities:
-        return
 
-    async_add_entities(entities)
+def _iter_entities(
+    coordinator: PuraDataUpdateCoordinator,
+) -> Iterator[PuraSensorEntity]:
+    """Yield the sensor entities for each supported device."""
+    for device_type, devices in coordinator.devices.items():
+        if not (descriptions := SENSORS_BY_TYPE.get(device_type)):
+            continue
+        for device in devices:
+            device_id = get_device_id(device)
+            for description in descriptions:
+                yield PuraSensorEntity(
+                    coordinator=coordinator,
+                    description=description,
+                    device_type=device_type,
+                    device_id=device_id,
+                )
 
 
 class PuraSensorEntity(PuraEntity, SensorEntity):
@@ -19,31 +19,43 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import PuraConfigEntry
 from .coordinator import PuraDataUpdateCoordinator
 from .entity import PuraEntity
-from .helpers import get_device_id
+from .helpers import descriptions_by_device_type, get_device_id
 
 
-@dataclass
-class RequiredKeysMixin:
-    """Required keys mixin."""
+@dataclass(frozen=True, kw_only=True)
+class PuraSwitchEntityDescription(SwitchEntityDescription):
+    """Pura switch entity description."""
 
     lookup_key: str
-    toggle_fn: Callable[[PuraEntity, bool], tuple[Callable[..., True], dict]]
+    toggle_fn: Callable[[PuraSwitchEntity, bool], functools.partial[bool]]
 
 
-@dataclass
-class PuraSwitchEntityDescription(SwitchEntityDescription, RequiredKeysMixin):
-    """Pura switch entity description."""
+AWAY_MODE_LOCATION_KEYS = ("latitude", "longitude", "radius")
+
+
+def _away_mode_job(switch: PuraSwitchEntity, value: bool) -> functools.partial[bool]:
+    """Return the job to toggle away mode, sending the device location when enabling."""
+    kwargs: dict[str, Any] = {"away_mode": value}
+    if value:
+        location = switch.get_device()["deviceLocation"]
+        for key in AWAY_MODE_LOCATION_KEYS:
+            if key in location:
+                kwargs[key] = location[key]
+    return functools.partial(
+        switch.coordinator.api.set_away_mode, switch._device_id, **kwargs
+    )
 
 
 SWITCHES: dict[tuple[str, ...], tuple[PuraSwitchEntityDescription, ...]] = {
-    ("wall"): (
+    ("wall",): (
         PuraSwitchEntityDescription(
             key="ambient_mode",
             name="Ambient mode",
             lookup_key="ambientMode",
-            toggle_fn=lambda self, value: (
-                self.coordinator.api.set_ambient_mode,
-                {"ambient_mode": value},
+            toggle_fn=lambda switch, value: functools.partial(
+                switch.coordinator.api.set_ambient_mode,
+                switch._device_id,
+                ambient_mode=value,
             ),
         ),
     ),
@@ -52,23 +64,13 @@ SWITCHES: dict[tuple[str, ...], tuple[PuraSwitchEntityDescription, ...]] = {
             key="away_mode",
             name="Away mode",
             lookup_key="awayMode",
-            toggle_fn=lambda self, value: (
-                self.coordinator.api.set_away_mode,
-                {"away_mode": value}
-                | (
-                    {
-                        k: v
-                        for k, v in self.get_device()["deviceLocation"].items()
-                        if k in ("radius", "longitude", "latitude")
-                    }
-                    if value
-                    else {}
-                ),
-            ),
+            toggle_fn=_away_mode_job,
         ),
     ),
 }
 
+SWITCHES_BY_TYPE = descriptions_by_device_type(SWITCHES)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: PuraConfigEntry, async_add_entities: AddEntitiesCallback
@@ -76,19 +78,21 @@ async def async_setup_entry(
     """Set up Pura switchs using config entry."""
     coordinator: PuraDataUpdateCoordinator = entry.runtime_data
 
-    entities = [
-        PuraSwitchEntity(
-            coordinator=coordinator,
-            description=description,
-            device_type=device_type,
-            device_id=get_device_id(device),
-        )
-        for device_types, descriptions in SWITCHES.items()
-        for device_type, devices in coordinator.devices.items()
-        if device_type in device_types
-        for device in devices
-        for description in descriptions
-    ]
+    entities: list[PuraSwitchEntity] = []
+    for device_type, devices in coordinator.devices.items():
+        if not (descriptions := SWITCHES_BY_TYPE.get(device_type)):
+            continue
+        for device in devices:
+            device_id = get_device_id(device)
+            entities.extend(
+                PuraSwitchEntity(
+                    coordinator=coordinator,
+                    description=description,
+                    device_type=device_type,
+                    device_id=device_id,
+                )
+                for description in descriptions
+            )
 
     if not entities:
         return
@@ -123,9 +127,6 @@ class PuraSwitchEntity(PuraEntity, SwitchEntity):
 
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the switch."""
-        _fn, _data = self.entity_description.toggle_fn(self, **kwargs)
-
-        if await self.hass.async_add_executor_job(
-            functools.partial(_fn, self._device_id, **_data)
-        ):
+        job = self.entity_description.toggle_fn(self, **kwargs)
+        if await self.hass.async_add_executor_job(job):
             await self.coordinator.async_request_refresh()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import logging
 
 from homeassistant.components.update import (
     UpdateDeviceClass,
@@ -14,25 +13,18 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import PuraConfigEntry
-from .coordinator import PuraDataUpdateCoordinator
+from .coordinator import PuraCarFirmwareDataUpdateCoordinator, PuraDataUpdateCoordinator
 from .entity import PuraEntity
 from .helpers import get_device_id
 
-_LOGGER = logging.getLogger(__name__)
 
-
-@dataclass
-class RequiredKeysMixin:
-    """Required keys mixin."""
+@dataclass(frozen=True, kw_only=True)
+class PuraUpdateEntityDescription(UpdateEntityDescription):
+    """Pura update entity description."""
 
     lookup_key: str
 
 
-@dataclass
-class PuraUpdateEntityDescription(UpdateEntityDescription, RequiredKeysMixin):
-    """Pura update entity description."""
-
-
 UPDATE = PuraUpdateEntityDescription(key="firmware", lookup_key="fwVersion")
 
 
@@ -42,22 +34,22 @@ async def async_setup_entry(
     """Set up Pura updates using config entry."""
     coordinator: PuraDataUpdateCoordinator = entry.runtime_data
 
-    entities = [
+    if not (devices := coordinator.devices.get("car")):
+        return
+
+    firmware_coordinator = PuraCarFirmwareDataUpdateCoordinator(hass, coordinator.api)
+    await firmware_coordinator.async_refresh()
+
+    async_add_entities(
         PuraUpdateEntity(
             coordinator=coordinator,
             description=UPDATE,
-            device_type=device_type,
+            device_type="car",
             device_id=get_device_id(device),
+            firmware_coordinator=firmware_coordinator,
         )
-        for device_type, devices in coordinator.devices.items()
-        if device_type == "car"
         for device in devices
-    ]
-
-    if not entities:
-        return
-
-    async_add_entities(entities, True)
+    )
 
 
 class PuraUpdateEntity(PuraEntity, UpdateEntity):
@@ -65,28 +57,39 @@ class PuraUpdateEntity(PuraEntity, UpdateEntity):
 
     entity_description: PuraUpdateEntityDescription
     _attr_device_class = UpdateDeviceClass.FIRMWARE
-    _attr_should_poll = True
     _attr_release_summary = (
         "https://help.pura.com/en/car_diffuser/Update-Pura-Car-Firmware"
     )
 
+    def __init__(
+        self,
+        coordinator: PuraDataUpdateCoordinator,
+        description: PuraUpdateEntityDescription,
+        device_type: str,
+        device_id: str,
+        firmware_coordinator: PuraCarFirmwareDataUpdateCoordinator,
+    ) -> None:
+        """Construct a PuraUpdateEntity."""
+        super().__init__(coordinator, description, device_type, device_id)
+        self._firmware_coordinator = firmware_coordinator
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._firmware_coordinator.async_add_listener(
+                self._handle_coordinator_update
+            )
+        )
+
     @property
     def installed_version(self) -> str | None:
         """Version installed and in use."""
         return self.get_device().get(self.entity_description.lookup_key)
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        try:
-            details: str = await self.hass.async_add_executor_job(
-                self.coordinator.api.get_latest_firmware_details, "car", "v1"
-            )
-            firmware = {
-                (part := line.split("=", 1))[0].lower(): part[1]
-                for line in details.split("\n")
-            }
-            self._attr_latest_version = ".".join(
-                firmware[key] for key in ("major", "minor", "patch")
-            )
-        except Exception as ex:  # pylint: disable=broad-except
-            _LOGGER.exception(ex)
+    @property
+    def latest_version(self) -> str | None:
+        """Latest version available for install."""
+        firmware = self._firmware_coordinator.data or {}
+        parts = [firmware.get(key) for key in ("major", "minor", "patch")]
+        return ".".join(parts) if all(parts) else None